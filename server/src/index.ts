@@ -2,6 +2,7 @@ import Fastify from 'fastify';
 import cors from '@fastify/cors';
 import dotenv from 'dotenv';
 import { readFileSync } from 'fs';
+import { createGunzip, createInflate } from 'zlib';
 import { join } from 'path';
 import { fileURLToPath } from 'url';
 import { dirname } from 'path';
@@ -88,6 +89,26 @@ fastify.addHook('onRequest', async (request, reply) => {
   }
 });
 
+// Decompress gzip/deflate request bodies, so clients can compress large span payloads
+// (span batches are highly redundant JSON and compress ~8-15x)
+fastify.addHook('preParsing', async (request, reply, payload) => {
+  const encoding = request.headers['content-encoding'];
+  if (!encoding || encoding === 'identity') {
+    return payload;
+  }
+  if (encoding !== 'gzip' && encoding !== 'deflate') {
+    reply.code(415).send({ error: `Unsupported Content-Encoding: ${encoding}` });
+    return payload;
+  }
+  const decompressed: any = payload.pipe(encoding === 'gzip' ? createGunzip() : createInflate());
+  // Content-Length describes the compressed body; tell Fastify so its length check passes
+  const contentLength = request.headers['content-length'];
+  if (contentLength) {
+    decompressed.receivedEncodedLength = parseInt(contentLength);
+  }
+  return decompressed;
+});
+
 // Health check
 // Security: Public endpoint - no authentication required.
 fastify.get('/health', async () => {